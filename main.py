@@ -1,4 +1,4 @@
-import codecs
+import select
 import sys
 import termios
 import time
@@ -7,6 +7,35 @@ from contextlib import contextmanager
 
 from pink import App, Input, Panel, Text
 
+# UTF-8 sequence length by lead byte: ASCII, continuation/invalid (0),
+# 2-byte (0xC2-0xDF), 3-byte (0xE0-0xEF), 4-byte (0xF0-0xF4), invalid.
+_UTF8_LEN = bytes(
+    [1] * 128 + [0] * 64 + [0] * 2 + [2] * 30 + [3] * 16 + [4] * 5 + [0] * 11
+)
+
+
+class BufferedStdin:
+    """Batch stdin reads so bursts of input cost one syscall, not one per byte."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._buf = bytearray()
+
+    def read(self, n):
+        while len(self._buf) < n:
+            # read1 returns whatever is available (blocking for the first
+            # byte), so pastes and key auto-repeat arrive in one chunk.
+            chunk = self._raw.read1(4096)
+            if not chunk:
+                break
+            self._buf += chunk
+        data = bytes(self._buf[:n])
+        del self._buf[:n]
+        return data
+
+    def has_buffered(self):
+        return bool(self._buf)
+
 
 @contextmanager
 def raw_mode(fd):
@@ -23,11 +52,16 @@ class Demo(App):
         super().__init__()
         self.lines = 10
         self.input = Input(width=None)
+        self._line_cache: list[Text] = []
 
     def compose(self):
+        # Only format and allocate Text nodes for lines that are new;
+        # reusing the instances lets their render memoization kick in.
+        while len(self._line_cache) < self.lines:
+            self._line_cache.append(Text(f"Line {len(self._line_cache) + 1}"))
         return [
             Panel(
-                [Text(f"Line {index + 1}") for index in range(self.lines)],
+                self._line_cache[: self.lines],
                 title="pink demo",
                 padding=1,
             ),
@@ -37,7 +71,6 @@ class Demo(App):
 
 def main():
     app = Demo()
-    decoder = codecs.getincrementaldecoder("utf-8")()
     try:
         if not sys.stdin.isatty():
             count = 1
@@ -49,38 +82,61 @@ def main():
             return
 
         count = 1
+        reader = BufferedStdin(sys.stdin.buffer)
+        fd = sys.stdin.fileno()
 
-        with raw_mode(sys.stdin.fileno()):
-            while True:
+        def more_input_pending():
+            if reader.has_buffered():
+                return True
+            ready, _, _ = select.select([fd], [], [], 0)
+            return bool(ready)
+
+        with raw_mode(fd):
+            running = True
+            while running:
                 app.lines = count
                 app.refresh()
                 count += 1
-                b = sys.stdin.buffer.read(1)
-                if not b:
-                    break
-
-                if b == b"\x1b":
-                    seq = b + sys.stdin.buffer.read(2)
-                    if seq == b"\x1b[D":
-                        app.input.move_left()
-                        continue
-                    if seq == b"\x1b[C":
-                        app.input.move_right()
-                        continue
-                    # Unknown escape sequence, ignore.
-                    continue
-
-                ch = decoder.decode(b, final=False)
-                if ch == "":
-                    continue
-                if ch in ("\r", "\n"):
-                    break
-                if ch == "\x03":  # Ctrl+C
-                    break
-                if ch in ("\x7f", "\b"):
-                    app.input.backspace()
-                else:
-                    app.input.insert(ch)
+
+                # Drain everything already available before refreshing
+                # again, so a paste triggers one redraw instead of one
+                # per character.
+                while True:
+                    b = reader.read(1)
+                    if not b:
+                        running = False
+                        break
+
+                    if b == b"\x1b":
+                        seq = b + reader.read(2)
+                        if seq == b"\x1b[D":
+                            app.input.move_left()
+                        elif seq == b"\x1b[C":
+                            app.input.move_right()
+                        # Unknown escape sequence, ignore.
+                    else:
+                        # The lead byte fully determines the sequence
+                        # length, so grab the continuation bytes in one go.
+                        need = _UTF8_LEN[b[0]]
+                        if need > 1:
+                            b += reader.read(need - 1)
+                        try:
+                            ch = b.decode("utf-8")
+                        except UnicodeDecodeError:
+                            ch = "�"
+                        if ch in ("\r", "\n"):
+                            running = False
+                            break
+                        if ch == "\x03":  # Ctrl+C
+                            running = False
+                            break
+                        if ch in ("\x7f", "\b"):
+                            app.input.backspace()
+                        else:
+                            app.input.insert(ch)
+
+                    if not more_input_pending():
+                        break
     finally:
         app.refresh(place_cursor_after=True)
         app.stop()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import shutil
+import bisect
+import itertools
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
 
+from .runtime import get_terminal_size
+
 
 class RenderResult(NamedTuple):
     lines: List[str]
@@ -14,6 +17,8 @@ class RenderResult(NamedTuple):
 class Component:
     """Base class for all pink components."""
 
+    __slots__ = ()
+
     def render(self) -> RenderResult:
         raise NotImplementedError
 
@@ -21,56 +26,135 @@ class Component:
 Renderable = Union[Component, str, Iterable["Renderable"]]
 
 
+# Runs of spaces recur at the same handful of widths frame after frame
+# (padding, empty rows, line fill), so share them across renders.
+_SPACES: dict[int, str] = {}
+
+
+def _sp(n: int) -> str:
+    s = _SPACES.get(n)
+    if s is None:
+        s = " " * n
+        _SPACES[n] = s
+    return s
+
+
 def _text_to_lines(text: str) -> List[str]:
     lines = text.splitlines()
     return lines if lines else [""]
 
 
-def _render_node(node: Renderable) -> RenderResult:
+def _render_component(node: Component, out: List[str]) -> Optional[Tuple[int, int]]:
+    result = node.render()
+    base_row = len(out)
+    if isinstance(result, RenderResult):
+        out.extend(result.lines)
+        if result.caret is not None:
+            return (base_row + result.caret[0], result.caret[1])
+        return None
+    out.extend(result)
+    return None
+
+
+def _render_str(node: str, out: List[str]) -> Optional[Tuple[int, int]]:
+    out.extend(_text_to_lines(node))
+    return None
+
+
+def _render_iter(node: Iterable[Renderable], out: List[str]) -> Optional[Tuple[int, int]]:
+    caret: Optional[Tuple[int, int]] = None
+    for child in node:
+        child_caret = _render_into(child, out)
+        if child_caret is not None:
+            caret = child_caret
+    return caret
+
+
+# Exact-type dispatch for the node kinds a tree is actually made of; the
+# built-in components are registered below their class definitions.
+_DISPATCH = {str: _render_str, list: _render_iter, tuple: _render_iter}
+
+
+def _render_into(node: Renderable, out: List[str]) -> Optional[Tuple[int, int]]:
+    """Append a node's lines to the shared output list, returning its caret.
+
+    Accumulating into one list avoids building and copying an intermediate
+    list at every level of the tree; the caret is returned relative to the
+    start of `out` so no per-level offset fixups are needed either.
+    """
+    fn = _DISPATCH.get(type(node))
+    if fn is not None:
+        return fn(node, out)
+    # Fall back to the isinstance chain for subclasses and other renderables.
     if isinstance(node, Component):
-        result = node.render()
-        if isinstance(result, RenderResult):
-            return result
-        return RenderResult(result)
+        return _render_component(node, out)
     if isinstance(node, str):
-        return RenderResult(_text_to_lines(str(node)))
+        return _render_str(node, out)
     if isinstance(node, Iterable):
-        lines: List[str] = []
-        caret: Optional[Tuple[int, int]] = None
-        for child in node:
-            result = _render_node(child)
-            base_row = len(lines)
-            lines.extend(result.lines)
-            if result.caret is not None:
-                caret = (base_row + result.caret[0], result.caret[1])
-        return RenderResult(lines, caret)
+        return _render_iter(node, out)
     raise TypeError(f"Cannot render node: {node!r}")
 
 
 def render_to_lines(node: Renderable) -> RenderResult:
     """Convert any renderable node into a flat list of text lines plus caret location."""
-    return _render_node(node)
+    lines: List[str] = []
+    caret = _render_into(node, lines)
+    return RenderResult(lines, caret)
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Text(Component):
     value: str
+    _cached_value: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_result: Optional[RenderResult] = field(default=None, init=False, repr=False, compare=False)
 
     def render(self) -> RenderResult:
         text = "" if self.value is None else str(self.value)
-        return RenderResult(_text_to_lines(text))
+        # Text nodes are typically reused across refreshes with the same
+        # value, so the split into lines only has to happen once.
+        if self._cached_result is not None and self._cached_value == text:
+            return self._cached_result
+        result = RenderResult(_text_to_lines(text))
+        self._cached_value = text
+        self._cached_result = result
+        return result
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Panel(Component):
     child: Renderable
     title: str | None = None
     padding: int = 0
+    _cached_key: Optional[Tuple[str | None, int]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_child: Optional[RenderResult] = field(default=None, init=False, repr=False, compare=False)
+    _cached_result: Optional[RenderResult] = field(default=None, init=False, repr=False, compare=False)
 
     def render(self) -> RenderResult:
         child_result = render_to_lines(self.child)
+        # Skip layout entirely when the child produced the same lines as
+        # last time and our own appearance hasn't changed.
+        key = (self.title, self.padding)
+        if (
+            self._cached_result is not None
+            and self._cached_key == key
+            and self._cached_child == child_result
+        ):
+            return self._cached_result
         body = child_result.lines
-        inner_width = max((_measure_width(line) for line in body), default=0)
+        # All-ASCII bodies (the common case) measure and pad with the
+        # C-level len/ljust; otherwise measure each line once and reuse
+        # the widths for padding.
+        if all(line.isascii() for line in body):
+            widths = list(map(len, body))
+            inner_width = max(widths, default=0)
+            padded_body = [line.ljust(inner_width) for line in body]
+        else:
+            widths = [_measure_width(line) for line in body]
+            inner_width = max(widths, default=0)
+            padded_body = [
+                _pad_to_width_known(line, line_width, inner_width)
+                for line, line_width in zip(body, widths)
+            ]
         pad = max(0, int(self.padding))
         content_width = inner_width + pad * 2
 
@@ -79,43 +163,69 @@ class Panel(Component):
 
         top_bar = label.ljust(content_width, "-") if label else "-" * content_width
 
+        empty_line = f"|{_sp(content_width)}|"
+        side_pad = _sp(pad)
+        tail_pad = _sp(content_width - pad - inner_width)
+
         lines: List[str] = [f"+{top_bar}+"]
-        empty_row = " " * content_width
         for _ in range(pad):
-            lines.append(f"|{empty_row}|")
-        for line in body:
-            padded_line = _pad_to_width(line, inner_width)
-            padded = " " * pad + padded_line + " " * pad
-            padded = padded.ljust(content_width)
-            lines.append(f"|{padded}|")
+            lines.append(empty_line)
+        for padded_line in padded_body:
+            lines.append(f"|{side_pad}{padded_line}{tail_pad}|")
         for _ in range(pad):
-            lines.append(f"|{empty_row}|")
+            lines.append(empty_line)
         lines.append(f"+{'-' * content_width}+")
         caret = None
         if child_result.caret is not None:
             row, col = child_result.caret
             caret = (1 + pad + row, 1 + pad + col)
-        return RenderResult(lines, caret)
+        result = RenderResult(lines, caret)
+        self._cached_key = key
+        self._cached_child = child_result
+        self._cached_result = result
+        return result
+
+
+_WIDE = frozenset(("W", "F"))
+
+# Per-character width cache; the unicodedata calls dominate width measurement,
+# so a dict hit makes the hot path a single lookup. Pre-populated with
+# printable ASCII since that is the overwhelming common case.
+_WIDTH_CACHE: dict[str, int] = {chr(code): 1 for code in range(0x20, 0x7F)}
 
 
 def _char_width(ch: str) -> int:
-    if unicodedata.combining(ch):
-        return 0
-    if unicodedata.east_asian_width(ch) in ("W", "F"):
-        return 2
-    return 1
+    width = _WIDTH_CACHE.get(ch)
+    if width is None:
+        if unicodedata.combining(ch):
+            width = 0
+        elif unicodedata.east_asian_width(ch) in _WIDE:
+            width = 2
+        else:
+            width = 1
+        _WIDTH_CACHE[ch] = width
+    return width
 
 
 def _measure_width(text: str) -> int:
+    # Pure-ASCII text is one column per character; isascii() is a cached
+    # flag check on CPython, so this skips the per-char loop entirely.
+    if text.isascii():
+        return len(text)
     return sum(_char_width(ch) for ch in text)
 
 
 def _pad_to_width(text: str, width: int) -> str:
-    extra = max(0, width - _measure_width(text))
-    return text + " " * extra
+    if text.isascii():
+        return text.ljust(width)
+    return _pad_to_width_known(text, _measure_width(text), width)
+
+
+def _pad_to_width_known(text: str, text_width: int, width: int) -> str:
+    return text + _sp(max(0, width - text_width))
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Input(Component):
     value: str = ""
     cursor: int = 0
@@ -141,27 +251,32 @@ class Input(Component):
             self.cursor += 1
 
     def _trim_to_width(self, target_width: int) -> tuple[str, int]:
-        chars = list(self.value)
-        widths = [_char_width(ch) for ch in chars]
-        total_width = sum(widths)
-        cursor_width = sum(widths[: self.cursor])
+        if self.value.isascii():
+            # Every character is one column wide, so trimming is plain
+            # index arithmetic on the string itself.
+            start = max(0, len(self.value) - target_width)
+            cursor_width = max(0, self.cursor - start)
+            return self.value[start:].ljust(target_width), cursor_width
+
+        cum = list(itertools.accumulate(map(_char_width, self.value)))
+        total_width = cum[-1] if cum else 0
+        cursor_width = cum[self.cursor - 1] if self.cursor else 0
         start = 0
+        visible_width = total_width
 
-        while total_width > target_width:
-            total_width -= widths[start]
-            cursor_width -= widths[start]
-            start += 1
-            if cursor_width < 0:
-                cursor_width = 0
-
-        visible_chars = "".join(chars[start:])
-        visible_width = _measure_width(visible_chars)
-        pad_width = max(0, target_width - visible_width)
-        padded = visible_chars + " " * pad_width
+        if total_width > target_width:
+            # Find the first index whose cumulative width covers the excess,
+            # instead of subtracting one character at a time.
+            need = total_width - target_width
+            start = bisect.bisect_left(cum, need) + 1
+            cursor_width = max(0, cursor_width - cum[start - 1])
+            visible_width = total_width - cum[start - 1]
+
+        padded = self.value[start:] + " " * max(0, target_width - visible_width)
         return padded, cursor_width
 
     def render(self) -> RenderResult:
-        term_cols = shutil.get_terminal_size(fallback=(80, 24)).columns
+        term_cols = get_terminal_size()[0]
         total_inner_pad = max(0, int(self.inner_padding)) * 2
         target_width = (
             self.width
@@ -186,3 +301,6 @@ class Input(Component):
             lines = [content]
             caret = (0, cursor_col)
         return RenderResult(lines, caret)
+
+
+_DISPATCH.update({Text: _render_component, Panel: _render_component, Input: _render_component})
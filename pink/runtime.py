@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import shutil
+import signal
 import sys
 from typing import List
 
@@ -11,6 +13,64 @@ CURSOR_HOME = CSI + "H"
 HIDE_CURSOR = CSI + "?25l"
 SHOW_CURSOR = CSI + "?25h"
 
+# Pre-encoded variants for the byte-oriented write path; escape sequences
+# are pure ASCII, so frames go straight to sys.stdout.buffer without the
+# text layer re-encoding every write.
+CSI_B = CSI.encode("ascii")
+CLEAR_TERMINAL_B = CLEAR_TERMINAL.encode("ascii")
+HIDE_CURSOR_B = HIDE_CURSOR.encode("ascii")
+SHOW_CURSOR_B = SHOW_CURSOR.encode("ascii")
+
+# Cursor-move sequences hit the same handful of positions frame after
+# frame, so cache the encoded bytes instead of re-running the f-string
+# format machinery per keystroke. Bounded so pathological inputs can't
+# grow them forever.
+_CUP_CACHE: dict[tuple[int, int], bytes] = {}
+_CSI_CACHE: dict[tuple[int, str], bytes] = {}
+
+
+def _cup(row: int, col: int) -> bytes:
+    """Cursor-position sequence (1-based row/col), cached."""
+    key = (row, col)
+    seq = _CUP_CACHE.get(key)
+    if seq is None:
+        if len(_CUP_CACHE) >= 4096:
+            _CUP_CACHE.clear()
+        seq = f"\x1b[{row};{col}H".encode("ascii")
+        _CUP_CACHE[key] = seq
+    return seq
+
+
+def _csi(n: int, suffix: str) -> bytes:
+    """Single-parameter CSI sequence (cursor up/down/column etc.), cached."""
+    key = (n, suffix)
+    seq = _CSI_CACHE.get(key)
+    if seq is None:
+        if len(_CSI_CACHE) >= 4096:
+            _CSI_CACHE.clear()
+        seq = f"\x1b[{n}{suffix}".encode("ascii")
+        _CSI_CACHE[key] = seq
+    return seq
+
+
+# Terminal size is an ioctl per query; cache it and only re-query after a
+# SIGWINCH (installed by Renderer) invalidates the cache.
+_term_size: tuple[int, int] | None = None
+
+
+def get_terminal_size() -> tuple[int, int]:
+    """Return (columns, rows), cached between window-size changes."""
+    global _term_size
+    if _term_size is None:
+        size = shutil.get_terminal_size(fallback=(80, 24))
+        _term_size = (size.columns, size.lines)
+    return _term_size
+
+
+def _invalidate_terminal_size(*_args) -> None:
+    global _term_size
+    _term_size = None
+
 
 class Renderer:
     """Render text blocks with ink-style redraw semantics."""
@@ -20,6 +80,30 @@ class Renderer:
         self._inline_mode = True
         # Row (0-based) of where we leave the cursor relative to our render block.
         self._inline_anchor_row: int | None = None
+        # Visible rows painted by the last fullscreen frame; None forces a
+        # full clear + repaint (first frame, resize, mode change).
+        self._prev_lines: List[str] | None = None
+        self._prev_size: tuple[int, int] | None = None
+        # Everything that determines a frame's output; identical frames
+        # are skipped without joining or writing anything.
+        self._prev_frame: tuple[List[str], tuple[int, int] | None, bool] | None = None
+        # Absolute (row, col) the cursor was last parked at in fullscreen
+        # mode, so an unmoved caret emits no positioning sequence.
+        self._prev_caret_abs: tuple[int, int] | None = None
+        # Frames go straight to the stdout fd: the loop is single-threaded,
+        # so the TextIOWrapper/BufferedWriter locks buy nothing per write.
+        try:
+            sys.stdout.flush()
+            self._fd: int | None = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            # stdout is not backed by a real fd (e.g. captured); fall back
+            # to the buffer layer.
+            self._fd = None
+        try:
+            signal.signal(signal.SIGWINCH, _invalidate_terminal_size)
+        except (ValueError, AttributeError):
+            # Not on the main thread, or a platform without SIGWINCH.
+            pass
 
     def present(
         self,
@@ -30,75 +114,124 @@ class Renderer:
         if not lines:
             lines = [""]
 
+        size = get_terminal_size()
+        rows = max(1, size[1])
+        if size != self._prev_size:
+            self._prev_size = size
+            self._prev_lines = None
+            self._prev_frame = None
+
+        if self._prev_frame == (lines, caret, place_cursor_after):
+            return
+        self._prev_frame = (list(lines), caret, place_cursor_after)
+
+        # Collect all escape sequences and content for this frame, then
+        # emit them in a single write so the terminal sees one atomic chunk.
+        parts: List[bytes] = []
+
         hide_cursor = caret is None
         if hide_cursor and not self._cursor_hidden:
-            sys.stdout.write(HIDE_CURSOR)
+            parts.append(HIDE_CURSOR_B)
             self._cursor_hidden = True
         if not hide_cursor and self._cursor_hidden:
-            sys.stdout.write(SHOW_CURSOR)
+            parts.append(SHOW_CURSOR_B)
             self._cursor_hidden = False
 
-        rows = shutil.get_terminal_size(fallback=(80, 24)).lines
-        rows = max(1, rows)
         content_height = len(lines)
 
         if self._inline_mode and content_height > rows:
             self._inline_mode = False
             self._inline_anchor_row = None
+            self._prev_lines = None
 
         if self._inline_mode:
-            self._render_inline(lines, caret, place_cursor_after)
+            self._render_inline(parts, lines, caret, place_cursor_after)
         else:
-            self._render_fullscreen(lines, caret, place_cursor_after, rows)
+            self._render_fullscreen(parts, lines, caret, place_cursor_after, rows)
 
-        sys.stdout.flush()
+        if parts:
+            self._write(b"".join(parts))
 
     def close(self) -> None:
         if self._cursor_hidden:
-            sys.stdout.write(SHOW_CURSOR)
-            sys.stdout.flush()
+            self._write(SHOW_CURSOR_B)
             self._cursor_hidden = False
 
+    def _write(self, buf: bytes) -> None:
+        if self._fd is None:
+            sys.stdout.buffer.write(buf)
+            sys.stdout.buffer.flush()
+            return
+        while buf:
+            buf = buf[os.write(self._fd, buf) :]
+
     def _render_fullscreen(
         self,
+        parts: List[bytes],
         lines: List[str],
         caret: tuple[int, int] | None,
         place_cursor_after: bool,
         rows: int,
     ) -> None:
-        text = "\r\n".join(lines)
-        # Clear screen + scrollback, then redraw full content.
-        sys.stdout.write(CLEAR_TERMINAL)
-        sys.stdout.write(text)
+        visible_start = max(0, len(lines) - rows)
+        visible = lines[visible_start:]
+        prev = self._prev_lines
+        damage_start = len(parts)
 
+        if prev is None:
+            # First fullscreen frame (or after a resize): clear screen +
+            # scrollback, then redraw full content.
+            parts.append(CLEAR_TERMINAL_B)
+            parts.append("\r\n".join(visible).encode("utf-8"))
+        else:
+            # Damage-oriented redraw: rewrite only the rows that changed
+            # since the previous frame instead of repainting every cell.
+            common = min(len(prev), len(visible))
+            for i in range(common):
+                if prev[i] != visible[i]:
+                    parts.append(
+                        _cup(i + 1, 1) + CSI_B + b"2K" + visible[i].encode("utf-8")
+                    )
+            for i in range(common, len(visible)):
+                parts.append(_cup(i + 1, 1) + visible[i].encode("utf-8"))
+            if len(visible) < len(prev):
+                parts.append(_cup(len(visible) + 1, 1) + CSI_B + b"0J")
+        self._prev_lines = visible
+        damaged = len(parts) > damage_start
+
+        target: tuple[int, int] | None = None
         if caret is not None and not place_cursor_after:
             row, col = caret
-            visible_start = max(0, len(lines) - rows)
             row = max(0, row - visible_start)
             row = min(rows - 1, row)
-            sys.stdout.write(CSI + f"{row + 1};{col + 1}H")
+            target = (row, col)
         elif place_cursor_after:
             target_row = rows - 1 if len(lines) >= rows else len(lines) - 1
-            target_row = max(0, target_row)
-            sys.stdout.write(CSI + f"{target_row + 1};1H")
+            target = (max(0, target_row), 0)
+
+        # Row rewrites leave the cursor wherever the last write ended, so
+        # positioning can only be skipped when nothing was repainted.
+        if target is not None and (damaged or target != self._prev_caret_abs):
+            parts.append(_cup(target[0] + 1, target[1] + 1))
+        self._prev_caret_abs = target
 
     def _render_inline(
         self,
+        parts: List[bytes],
         lines: List[str],
         caret: tuple[int, int] | None,
         place_cursor_after: bool,
     ) -> None:
         # Move back to the start of our render block based on where we left the cursor.
         if self._inline_anchor_row is not None:
-            sys.stdout.write("\r")
+            parts.append(b"\r")
             if self._inline_anchor_row:
-                sys.stdout.write(CSI + f"{self._inline_anchor_row}A")
+                parts.append(_csi(self._inline_anchor_row, "A"))
 
         # Clear everything from the cursor down so we don't trample content above.
-        sys.stdout.write(CSI + "0J")
+        parts.append(CSI_B + b"0J")
 
-        text = "\r\n".join(lines)
-        sys.stdout.write(text)
+        parts.append("\r\n".join(lines).encode("utf-8"))
 
         height = len(lines)
         target_row: int
@@ -113,11 +246,11 @@ class Renderer:
             target_col = 0
 
         # Move cursor to requested position relative to the start of the block.
-        sys.stdout.write("\r")
+        parts.append(b"\r")
         if height > 1:
-            sys.stdout.write(CSI + f"{height - 1}A")
+            parts.append(_csi(height - 1, "A"))
         if target_row > 0:
-            sys.stdout.write(CSI + f"{target_row}B")
-        sys.stdout.write(CSI + f"{target_col + 1}G")
+            parts.append(_csi(target_row, "B"))
+        parts.append(_csi(target_col + 1, "G"))
 
         self._inline_anchor_row = target_row